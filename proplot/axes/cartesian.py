@@ -485,22 +485,21 @@ class CartesianAxes(shared._SharedAxes, plot.PlotAxes):
         sides = ('bottom', 'top') if s == 'x' else ('left', 'right')
         l0, l1 = getattr(self, f'get_{s}lim')()
         bounds = tuple(self.spines[side].get_bounds() or (None, None) for side in sides)
-        skipticks = lambda ticks: [  # noqa: E731
-            x for x in ticks
-            if not any(x < _not_none(b0, l0) or x > _not_none(b1, l1) for (b0, b1) in bounds)  # noqa: E501
-        ]
+        lo = max(_not_none(b0, l0) for b0, _ in bounds)
+        hi = min(_not_none(b1, l1) for _, b1 in bounds)
+        skipticks = lambda ticks: ticks[(ticks >= lo) & (ticks <= hi)]  # noqa: E731
         if fixticks or any(x is not None for b in bounds for x in b):
             # Major locator
             locator = getattr(axis, '_major_locator_cached', None)
             if locator is None:
                 locator = axis._major_locator_cached = axis.get_major_locator()
-            locator = constructor.Locator(skipticks(locator()))
+            locator = constructor.Locator(skipticks(np.asarray(locator())))
             axis.set_major_locator(locator)
             # Minor locator
             locator = getattr(axis, '_minor_locator_cached', None)
             if locator is None:
                 locator = axis._minor_locator_cached = axis.get_minor_locator()
-            locator = constructor.Locator(skipticks(locator()))
+            locator = constructor.Locator(skipticks(np.asarray(locator())))
             axis.set_minor_locator(locator)
 
     def _get_spine_side(self, s, loc):
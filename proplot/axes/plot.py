@@ -4,6 +4,8 @@ The second-level axes subclass used for all proplot figures.
 Implements plotting method overrides.
 """
 import contextlib
+import copy
+import functools
 import inspect
 import itertools
 import re
@@ -55,6 +57,17 @@ __all__ = ['PlotAxes']
 # This is half of rc['patch.linewidth'] of 0.6. Half seems like a nice default.
 EDGEWIDTH = 0.3
 
+# Default spy() colormap. This is copied by constructor.Colormap() before it is
+# applied, so it is safe to build it only once rather than on every call.
+SPYCMAP = pcolors.DiscreteColormap(['w', 'k'], '_no_name')
+
+# Explicit edge properties that disable the _fix_patch_edges() default edges.
+EDGEKEYS = frozenset(
+    key + suffix
+    for key in ('linewidth', 'linestyle', 'edgecolor')  # patches and collections
+    for suffix in ('', 's')
+)
+
 # Data argument docstrings
 _args_1d_docstring = """
 *args : {y} or {x}, {y}
@@ -1210,16 +1223,16 @@ def _get_vert(vert=None, orientation=None, **kwargs):
         return kwargs, True  # fallback
 
 
-def _parse_vert(
-    vert=None, orientation=None, default_vert=None, default_orientation=None, **kwargs
-):
+def _parse_vert(kwargs, *, default_vert=None, default_orientation=None):
     """
     Interpret both 'vert' and 'orientation' and add to outgoing keyword args
-    if a default is provided.
+    if a default is provided. The keyword args are modified in-place.
     """
     # NOTE: Users should only pass these to hist, boxplot, or violinplot. To change
     # the plot, scatter, area, or bar orientation users should use the differently
     # named functions. Internally, however, they use these keyword args.
+    vert = kwargs.pop('vert', None)
+    orientation = kwargs.pop('orientation', None)
     if default_vert is not None:
         kwargs['vert'] = _not_none(
             vert=vert,
@@ -1234,7 +1247,39 @@ def _parse_vert(
         )
     if kwargs.get('orientation', None) not in (None, 'horizontal', 'vertical'):
         raise ValueError("Orientation must be either 'horizontal' or 'vertical'.")
-    return kwargs
+
+
+class _SilentList(cbook.silent_list):
+    """
+    A `~matplotlib.cbook.silent_list` that infers the type name from the
+    first element only when the list is printed.
+    """
+    def __init__(self, seq=None):
+        super().__init__(None, seq)
+
+    def __repr__(self):
+        if not self:
+            return '<an empty list>'
+        return f'<a list of {len(self)} {type(self[0]).__name__} objects>'
+
+
+def _is_color_like(c):
+    """
+    Return whether the input is a single color. This skips matplotlib's exception-based
+    color parsing for arrays that are too large to be a single RGB[A] color.
+    """
+    if isinstance(c, np.ndarray) and c.size > 4:
+        return False
+    return mcolors.is_color_like(c)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_native(cls, name):
+    """
+    Return the native plotting method that follows `PlotAxes` in the method
+    resolution order. This avoids repeating the lookup for every plotting call.
+    """
+    return getattr(super(PlotAxes, cls), name)
 
 
 def _inside_seaborn_call():
@@ -1277,6 +1322,7 @@ class PlotAxes(base.Axes):
         proplot.axes.GeoAxes
         """
         super().__init__(*args, **kwargs)
+        self._cmap_cache = {}  # see _parse_cmap_object
 
     def _call_native(self, name, *args, **kwargs):
         """
@@ -1290,7 +1336,7 @@ class PlotAxes(base.Axes):
             if self._name == 'basemap':
                 obj = getattr(self.projection, name)(*args, ax=self, **kwargs)
             else:
-                obj = getattr(super(), name)(*args, **kwargs)
+                obj = _get_native(type(self), name)(self, *args, **kwargs)
         return obj
 
     def _call_negpos(
@@ -1668,13 +1714,12 @@ class PlotAxes(base.Axes):
         # enough to hide lines but thin enough to not add 'nubs' to corners of boxes.
         # See: https://github.com/jklymak/contourfIssues
         # See: https://stackoverflow.com/q/15003353/4970632
+        if kwargs and not EDGEKEYS.isdisjoint(kwargs):
+            return
         edgefix = _not_none(edgefix, rc.edgefix, True)
         linewidth = EDGEWIDTH if edgefix is True else 0 if edgefix is False else edgefix
         if not linewidth:
             return
-        keys = ('linewidth', 'linestyle', 'edgecolor')  # patches and collections
-        if any(key + suffix in kwargs for key in keys for suffix in ('', 's')):
-            return
         rasterized = obj.get_rasterized() if isinstance(obj, martist.Artist) else False
         if rasterized:
             return
@@ -1688,7 +1733,7 @@ class PlotAxes(base.Axes):
             cmap = obj.cmap
             if not cmap._isinit:
                 cmap._init()
-            if not all(cmap._lut[:-1, 3] == 1):  # skip for cmaps with transparency
+            if not np.all(cmap._lut[:-1, 3] == 1):  # skip for cmaps with transparency
                 return
 
         # Apply fixes
@@ -2087,7 +2132,7 @@ class PlotAxes(base.Axes):
         # NOTE: This function is positioned above the _parse_cmap and _parse_cycle
         # functions and helper functions.
         parsers = (self._parse_cmap, *self._level_parsers)
-        if c is None or mcolors.is_color_like(c):
+        if c is None or _is_color_like(c):
             if infer_rgb and c is not None:
                 c = pcolors.to_hex(c)  # avoid scatter() ambiguous color warning
             if apply_cycle:  # False for scatter() so we can wait to get correct 'N'
@@ -2192,7 +2237,7 @@ class PlotAxes(base.Axes):
         if cmap is not None:
             if plot_lines:
                 cmap_kw['default_luminance'] = constructor.DEFAULT_CYCLE_LUMINANCE
-            cmap = constructor.Colormap(cmap, **cmap_kw)
+            cmap = self._parse_cmap_object(cmap, **cmap_kw)
             name = re.sub(r'\A_*(.*?)(?:_r|_s|_copy)*\Z', r'\1', cmap.name.lower())
             if not any(name in opts for opts in pcolors.CMAPS_DIVERGING.items()):
                 autodiverging = False  # avoid auto-truncation of sequential colormaps
@@ -2271,7 +2316,7 @@ class PlotAxes(base.Axes):
                 cmap = rc['cmap.' + tuple(key for key, b in modes.items() if b)[0]]
             else:
                 cmap = rc['image.cmap']
-            cmap = constructor.Colormap(cmap, **cmap_kw)
+            cmap = self._parse_cmap_object(cmap, **cmap_kw)
 
         # Create the discrete normalizer
         # Then finally warn and remove unused args
@@ -2296,6 +2341,41 @@ class PlotAxes(base.Axes):
 
         return kwargs
 
+    def _parse_cmap_object(self, cmap, **cmap_kw):
+        """
+        Return the colormap generated by `~proplot.constructor.Colormap`. Colormaps
+        generated from registered names are cached and copied on successive calls.
+        """
+        # NOTE: Generating and initializing colormaps is expensive (especially the
+        # perceptual colormap lookup tables) and in e.g. animations is repeated with
+        # identical arguments for every frame. The copies are deep so that users can
+        # safely modify them (e.g. set_alpha() modifies the segment data in place).
+        # Cached colormaps are invalidated when the source colormap is re-registered.
+        # Names that are not registered (e.g. colors like 'C0' or 'red') are never
+        # cached since the resulting colormap depends on rc settings like the color
+        # cycle and the lookup table size. Clear the cache if it gets too large.
+        key = source = None
+        if isinstance(cmap, str):
+            database = pcolors._cmap_database
+            source = database._regex_suffix.sub('', cmap)
+            source = dict.get(database, database._translate_key(source, mirror=False))
+        if source is not None:
+            key = (cmap, *sorted(cmap_kw.items()))
+            try:
+                hash(key)
+            except TypeError:
+                key = None
+        if key is None:
+            return constructor.Colormap(cmap, **cmap_kw)
+        cache = self._cmap_cache.get(key, None)
+        if cache is not None and cache[0] is source:
+            return copy.deepcopy(cache[1])
+        if len(self._cmap_cache) >= 32:
+            self._cmap_cache.clear()
+        cmap = constructor.Colormap(cmap, **cmap_kw)
+        self._cmap_cache[key] = (source, copy.deepcopy(cmap))
+        return cmap
+
     def _parse_cycle(
         self, ncycle=None, *, cycle=None, cycle_kw=None,
         cycle_manually=None, return_cycle=False, **kwargs
@@ -2914,7 +2994,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.plot)s
         """
-        kwargs = _parse_vert(default_vert=True, **kwargs)
+        _parse_vert(kwargs, default_vert=True)
         return self._apply_plot(*args, **kwargs)
 
     @inputs._preprocess_or_redirect('y', 'x', allow_extra=True)
@@ -2923,7 +3003,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.plotx)s
         """
-        kwargs = _parse_vert(default_vert=False, **kwargs)
+        _parse_vert(kwargs, default_vert=False)
         return self._apply_plot(*args, **kwargs)
 
     def _apply_step(self, *pairs, vert=True, **kwargs):
@@ -2961,7 +3041,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.step)s
         """
-        kwargs = _parse_vert(default_vert=True, **kwargs)
+        _parse_vert(kwargs, default_vert=True)
         return self._apply_step(*args, **kwargs)
 
     @inputs._preprocess_or_redirect('y', 'x', allow_extra=True)
@@ -2970,7 +3050,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.stepx)s
         """
-        kwargs = _parse_vert(default_vert=False, **kwargs)
+        _parse_vert(kwargs, default_vert=False)
         return self._apply_step(*args, **kwargs)
 
     def _apply_stem(
@@ -3026,7 +3106,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.stem)s
         """
-        kwargs = _parse_vert(default_orientation='vertical', **kwargs)
+        _parse_vert(kwargs, default_orientation='vertical')
         return self._apply_stem(*args, **kwargs)
 
     @inputs._preprocess_or_redirect('x', 'y')
@@ -3035,7 +3115,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.stemx)s
         """
-        kwargs = _parse_vert(default_orientation='horizontal', **kwargs)
+        _parse_vert(kwargs, default_orientation='horizontal')
         return self._apply_stem(*args, **kwargs)
 
     @inputs._preprocess_or_redirect('x', 'y', ('c', 'color', 'colors', 'values'))
@@ -3181,7 +3261,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.vlines)s
         """
-        kwargs = _parse_vert(default_vert=True, **kwargs)
+        _parse_vert(kwargs, default_vert=True)
         return self._apply_lines(*args, **kwargs)
 
     # WARNING: breaking change from native 'xmin' and 'xmax'
@@ -3191,7 +3271,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.hlines)s
         """
-        kwargs = _parse_vert(default_vert=False, **kwargs)
+        _parse_vert(kwargs, default_vert=False)
         return self._apply_lines(*args, **kwargs)
 
     def _parse_markersize(
@@ -3284,7 +3364,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.scatter)s
         """
-        kwargs = _parse_vert(default_vert=True, **kwargs)
+        _parse_vert(kwargs, default_vert=True)
         return self._apply_scatter(*args, **kwargs)
 
     @inputs._preprocess_or_redirect(
@@ -3299,7 +3379,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.scatterx)s
         """
-        kwargs = _parse_vert(default_vert=False, **kwargs)
+        _parse_vert(kwargs, default_vert=False)
         return self._apply_scatter(*args, **kwargs)
 
     def _apply_fill(
@@ -3370,7 +3450,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.fill_between)s
         """
-        kwargs = _parse_vert(default_vert=True, **kwargs)
+        _parse_vert(kwargs, default_vert=True)
         return self._apply_fill(*args, **kwargs)
 
     @inputs._preprocess_or_redirect('y', 'x1', 'x2', 'where')
@@ -3382,7 +3462,7 @@ class PlotAxes(base.Axes):
         """
         # NOTE: The 'horizontal' orientation will be inferred by downstream
         # wrappers using the function name.
-        kwargs = _parse_vert(default_vert=False, **kwargs)
+        _parse_vert(kwargs, default_vert=False)
         return self._apply_fill(*args, **kwargs)
 
     @staticmethod
@@ -3467,7 +3547,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.bar)s
         """
-        kwargs = _parse_vert(default_orientation='vertical', **kwargs)
+        _parse_vert(kwargs, default_orientation='vertical')
         return self._apply_bar(*args, **kwargs)
 
     # WARNING: Swap 'height' and 'width' here so that they are always relative
@@ -3479,7 +3559,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.barh)s
         """
-        kwargs = _parse_vert(default_orientation='horizontal', **kwargs)
+        _parse_vert(kwargs, default_orientation='horizontal')
         return self._apply_bar(*args, **kwargs)
 
     # WARNING: 'labels' and 'colors' no longer passed through `data` (seems like
@@ -3503,7 +3583,7 @@ class PlotAxes(base.Axes):
         objs = self._call_native(
             'pie', x, explode, labeldistance=pad, wedgeprops=wedge_kw, **kw
         )
-        objs = tuple(cbook.silent_list(type(seq[0]).__name__, seq) for seq in objs)
+        objs = tuple(map(_SilentList, objs))
         self._fix_patch_edges(objs[0], **edgefix_kw, **wedge_kw)
         return objs
 
@@ -3585,7 +3665,7 @@ class PlotAxes(base.Axes):
         artists = self._call_native('boxplot', y, vert=vert, **kw)
         artists = artists or {}  # necessary?
         artists = {
-            key: cbook.silent_list(type(objs[0]).__name__, objs) if objs else objs
+            key: _SilentList(objs) if objs else objs
             for key, objs in artists.items()
         }
 
@@ -3593,18 +3673,21 @@ class PlotAxes(base.Axes):
         for key, aprops in props.items():
             if key not in artists:  # possible if not rendered
                 continue
+            # NOTE: There are two caps and whiskers per box. Resolve the index
+            # divisor and the list-like properties once rather than for every line.
             objs = artists[key]
+            div = 2 if key in ('caps', 'whiskers') else 1
+            lprops = {
+                name: value for name, value in aprops.items()
+                if isinstance(value, (list, np.ndarray))
+            }
             for i, obj in enumerate(objs):
                 # Update lines used for boxplot components
                 # TODO: Test this thoroughly!
-                iprops = {
-                    key: (
-                        value[i // 2 if key in ('caps', 'whiskers') else i]
-                        if isinstance(value, (list, np.ndarray))
-                        else value
-                    )
-                    for key, value in aprops.items()
-                }
+                iprops = aprops.copy()
+                iprops.update(
+                    {name: value[i // div] for name, value in lprops.items()}
+                )
                 obj.update(iprops)
                 # "Filled" boxplot by adding patch beneath line path
                 if key == 'boxes' and (
@@ -3647,7 +3730,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.boxplot)s
         """
-        kwargs = _parse_vert(default_vert=True, **kwargs)
+        _parse_vert(kwargs, default_vert=True)
         return self._apply_boxplot(*args, **kwargs)
 
     @inputs._preprocess_or_redirect('positions', 'x')
@@ -3656,7 +3739,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.boxploth)s
         """
-        kwargs = _parse_vert(default_vert=False, **kwargs)
+        _parse_vert(kwargs, default_vert=False)
         return self._apply_boxplot(*args, **kwargs)
 
     def _apply_violinplot(
@@ -3709,15 +3792,20 @@ class PlotAxes(base.Axes):
 
         # Modify body settings
         artists = artists or {}  # necessary?
+        # NOTE: Convert fill colors to an RGBA array once so that matplotlib does not
+        # have to parse the color specs again for every violin body. Skip this when
+        # 'none' is passed since matplotlib handles that string specially.
         bodies = artists.pop('bodies', ())  # should be no other entries
         if bodies:
-            bodies = cbook.silent_list(type(bodies[0]).__name__, bodies)
+            bodies = _SilentList(bodies)
+            if not any(
+                isinstance(color, str) and color.lower() == 'none'
+                for color in fillcolor
+            ):
+                fillcolor = mcolors.to_rgba_array(fillcolor)
         for i, body in enumerate(bodies):
-            body.set_alpha(1.0)  # change default to 1.0
-            if fillcolor[i] is not None:
-                body.set_facecolor(fillcolor[i])
-            if fillalpha is not None:
-                body.set_alpha(fillalpha[i])
+            body.set_alpha(_not_none(fillalpha, 1.0))  # change default to 1.0
+            body.set_facecolor(fillcolor[i])
             if edgecolor is not None:
                 body.set_edgecolor(edgecolor)
             if linewidth is not None:
@@ -3750,7 +3838,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.violinplot)s
         """
-        kwargs = _parse_vert(default_vert=True, **kwargs)
+        _parse_vert(kwargs, default_vert=True)
         return self._apply_violinplot(*args, **kwargs)
 
     @inputs._preprocess_or_redirect('positions', 'x')
@@ -3759,7 +3847,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.violinploth)s
         """
-        kwargs = _parse_vert(default_vert=False, **kwargs)
+        _parse_vert(kwargs, default_vert=False)
         return self._apply_violinplot(*args, **kwargs)
 
     def _apply_hist(
@@ -3797,14 +3885,16 @@ class PlotAxes(base.Axes):
             self._fix_patch_edges(obj[2], **edgefix_kw, **kw)
         # Revert to mpl < 3.3 behavior where silent_list was always returned for
         # non-bar-type histograms. Because consistency.
+        # NOTE: Only rebuild the container when at least one sublist needs wrapping.
         res = obj[2]
         if type(res) is list:  # 'step' histtype plots
             res = cbook.silent_list('Polygon', res)
             obj = (*obj[:2], res)
-        else:
-            for i, sub in enumerate(res):
-                if type(sub) is list:
-                    res[i] = cbook.silent_list('Polygon', sub)
+        elif any(type(sub) is list for sub in res):
+            res[:] = [
+                cbook.silent_list('Polygon', sub) if type(sub) is list else sub
+                for sub in res
+            ]
         self._update_guide(res, **guide_kw)
         return obj
 
@@ -3815,7 +3905,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.hist)s
         """
-        kwargs = _parse_vert(default_orientation='vertical', **kwargs)
+        _parse_vert(kwargs, default_orientation='vertical')
         return self._apply_hist(*args, **kwargs)
 
     @inputs._preprocess_or_redirect('y', 'bins', keywords='weights')
@@ -3824,7 +3914,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.histh)s
         """
-        kwargs = _parse_vert(default_orientation='horizontal', **kwargs)
+        _parse_vert(kwargs, default_orientation='horizontal')
         return self._apply_hist(*args, **kwargs)
 
     @inputs._preprocess_or_redirect('x', 'y', 'bins', keywords='weights')
@@ -3850,9 +3940,8 @@ class PlotAxes(base.Axes):
         # WARNING: Cannot use automatic level generation here until counts are
         # estimated. Inside _parse_level_vals if no manual levels were provided then
         # _parse_level_num is skipped and args like levels=10 or locator=5 are ignored
-        kw = kwargs.copy()
         x, y, kw = self._parse_1d_args(
-            x, y, autoreverse=False, autovalues=True, **kw
+            x, y, autoreverse=False, autovalues=True, **kwargs
         )
         kw.update(_pop_props(kw, 'collection'))  # takes LineCollection props
         kw = self._parse_cmap(x, y, y, skip_autolev=True, default_discrete=False, **kw)
@@ -3994,9 +4083,14 @@ class PlotAxes(base.Axes):
         coords = getattr(obj, '_coordinates', None)
         xlocator = ylocator = None
         if coords is not None:
-            coords = 0.5 * (coords[1:, ...] + coords[:-1, ...])
-            coords = 0.5 * (coords[:, 1:, :] + coords[:, :-1, :])
-            xlocator, ylocator = coords[0, :, 0], coords[:, 0, 1]
+            # NOTE: Only the first row and column of the grid box centers are
+            # needed so compute them from 1D slices rather than the full 2D grid.
+            xedges = np.add(coords[0, :, 0], coords[1, :, 0], dtype=float)
+            yedges = np.add(coords[:, 0, 1], coords[:, 1, 1], dtype=float)
+            xlocator = np.add(xedges[1:], xedges[:-1])
+            ylocator = np.add(yedges[1:], yedges[:-1])
+            xlocator *= 0.25
+            ylocator *= 0.25
         kw = {'aspect': aspect, 'xgrid': False, 'ygrid': False}
         if xlocator is not None and self.xaxis.isDefault_majloc:
             kw['xlocator'] = xlocator
@@ -4019,7 +4113,7 @@ class PlotAxes(base.Axes):
         x, y, u, v, kw = self._parse_2d_args(x, y, u, v, allow1d=True, autoguide=False, **kwargs)  # noqa: E501
         kw.update(_pop_props(kw, 'line'))  # applied to barbs
         c, kw = self._parse_color(x, y, c, **kw)
-        if mcolors.is_color_like(c):
+        if _is_color_like(c):
             kw['barbcolor'], c = c, None
         a = [x, y, u, v]
         if c is not None:
@@ -4039,7 +4133,7 @@ class PlotAxes(base.Axes):
         kw.update(_pop_props(kw, 'line'))  # applied to arrow outline
         c, kw = self._parse_color(x, y, c, **kw)
         color = None
-        if mcolors.is_color_like(c):
+        if _is_color_like(c):
             color, c = c, None
         if color is not None:
             kw['color'] = color
@@ -4087,12 +4181,11 @@ class PlotAxes(base.Axes):
         """
         %(plot.tricontour)s
         """
-        kw = kwargs.copy()
         if x is None or y is None or z is None:
             raise ValueError('Three input arguments are required.')
-        kw.update(_pop_props(kw, 'collection'))
+        kwargs.update(_pop_props(kwargs, 'collection'))
         kw = self._parse_cmap(
-            x, y, z, min_levels=1, plot_lines=True, plot_contours=True, **kw
+            x, y, z, min_levels=1, plot_lines=True, plot_contours=True, **kwargs
         )
         labels_kw = _pop_params(kw, self._add_auto_labels)
         guide_kw = _pop_params(kw, self._update_guide)
@@ -4110,12 +4203,11 @@ class PlotAxes(base.Axes):
         """
         %(plot.tricontourf)s
         """
-        kw = kwargs.copy()
         if x is None or y is None or z is None:
             raise ValueError('Three input arguments are required.')
-        kw.update(_pop_props(kw, 'collection'))
-        contour_kw = _pop_kwargs(kw, 'edgecolors', 'linewidths', 'linestyles')
-        kw = self._parse_cmap(x, y, z, plot_contours=True, **kw)
+        kwargs.update(_pop_props(kwargs, 'collection'))
+        contour_kw = _pop_kwargs(kwargs, 'edgecolors', 'linewidths', 'linestyles')
+        kw = self._parse_cmap(x, y, z, plot_contours=True, **kwargs)
         edgefix_kw = _pop_params(kw, self._fix_patch_edges)
         labels_kw = _pop_params(kw, self._add_auto_labels)
         guide_kw = _pop_params(kw, self._update_guide)
@@ -4136,11 +4228,10 @@ class PlotAxes(base.Axes):
         """
         %(plot.tripcolor)s
         """
-        kw = kwargs.copy()
         if x is None or y is None or z is None:
             raise ValueError('Three input arguments are required.')
-        kw.update(_pop_props(kw, 'collection'))
-        kw = self._parse_cmap(x, y, z, **kw)
+        kwargs.update(_pop_props(kwargs, 'collection'))
+        kw = self._parse_cmap(x, y, z, **kwargs)
         edgefix_kw = _pop_params(kw, self._fix_patch_edges)
         labels_kw = _pop_params(kw, self._add_auto_labels)
         guide_kw = _pop_params(kw, self._update_guide)
@@ -4159,8 +4250,7 @@ class PlotAxes(base.Axes):
         """
         %(plot.imshow)s
         """
-        kw = kwargs.copy()
-        kw = self._parse_cmap(z, default_discrete=False, **kw)
+        kw = self._parse_cmap(z, default_discrete=False, **kwargs)
         guide_kw = _pop_params(kw, self._update_guide)
         m = self._call_native('imshow', z, **kw)
         self._update_guide(m, queue_colorbar=False, **guide_kw)
@@ -4185,10 +4275,8 @@ class PlotAxes(base.Axes):
         """
         %(plot.spy)s
         """
-        kw = kwargs.copy()
-        kw.update(_pop_props(kw, 'line'))  # takes valid Line2D properties
-        default_cmap = pcolors.DiscreteColormap(['w', 'k'], '_no_name')
-        kw = self._parse_cmap(z, default_cmap=default_cmap, **kw)
+        kwargs.update(_pop_props(kwargs, 'line'))  # takes valid Line2D properties
+        kw = self._parse_cmap(z, default_cmap=SPYCMAP, **kwargs)
         guide_kw = _pop_params(kw, self._update_guide)
         m = self._call_native('spy', z, **kw)
         self._update_guide(m, queue_colorbar=False, **guide_kw)
@@ -4225,11 +4313,11 @@ class PlotAxes(base.Axes):
             labels = n * [labels]
         if len(labels) != n:
             raise ValueError(f'Array has {n} columns but got {len(labels)} labels.')
-        if labels is not None:
-            labels = [
-                str(_not_none(label, ''))
-                for label in inputs._to_numpy_array(labels)
-            ]
+        if labels is not None:  # convert in one pass rather than label-by-label
+            labels = inputs._to_numpy_array(labels)
+            if labels.dtype == object:
+                labels = np.where(np.equal(labels, None), '', labels)
+            labels = labels.astype(str).tolist()
         else:
             labels = n * [None]
 
@@ -61,6 +61,9 @@ __all__ = [
 DEFAULT_CYCLE_SAMPLES = 10
 DEFAULT_CYCLE_LUMINANCE = 90
 
+# Formatter string detection
+REGEX_STRMETHOD = re.compile(r'{x(:.+)?}')
+
 # Normalizer registry
 NORMS = {
     'none': mcolors.NoNorm,
@@ -130,7 +133,7 @@ FORMATTERS = {  # note default LogFormatter uses ugly e+00 notation
     'date': mdates.AutoDateFormatter,
     'scalar': mticker.ScalarFormatter,
     'simple': pticker.SimpleFormatter,
-    'fixed': mticker.FixedLocator,
+    'fixed': mticker.FixedFormatter,
     'index': pticker.IndexFormatter,
     'sci': pticker.SciFormatter,
     'sigfig': pticker.SigFigFormatter,
@@ -333,6 +336,14 @@ RESOS_BASEMAP = {
 }
 
 
+def _is_number(obj):
+    """
+    Return whether the object is a number. Common concrete types are checked
+    before the slower `numbers.Number` abstract base class.
+    """
+    return isinstance(obj, (int, float, np.number)) or isinstance(obj, Number)
+
+
 def _modify_colormap(cmap, *, cut, left, right, reverse, shift, alpha, samples):
     """
     Modify colormap using a variety of methods.
@@ -892,13 +903,14 @@ def Norm(norm, *args, **kwargs):
     proplot.colors.DiscreteNorm
     proplot.constructor.Colormap
     """
-    if np.iterable(norm) and not isinstance(norm, str):
+    if not isinstance(norm, str) and np.iterable(norm):
         norm, *args = *norm, *args
     if isinstance(norm, mcolors.Normalize):
         return copy.copy(norm)
     if not isinstance(norm, str):
         raise ValueError(f'Invalid norm name {norm!r}. Must be string.')
-    if norm not in NORMS:
+    cls = NORMS.get(norm, None)
+    if cls is None:
         raise ValueError(
             f'Unknown normalizer {norm!r}. Options are: '
             + ', '.join(map(repr, NORMS))
@@ -906,7 +918,7 @@ def Norm(norm, *args, **kwargs):
         )
     if norm == 'symlog' and not args and 'linthresh' not in kwargs:
         kwargs['linthresh'] = 1  # special case, needs argument
-    return NORMS[norm](*args, **kwargs)
+    return cls(*args, **kwargs)
 
 
 def Locator(locator, *args, discrete=False, **kwargs):
@@ -992,8 +1004,8 @@ def Locator(locator, *args, discrete=False, **kwargs):
     proplot.axes.Axes.colorbar
     proplot.constructor.Formatter
     """  # noqa: E501
-    if np.iterable(locator) and not isinstance(locator, str) and not all(
-        isinstance(num, Number) for num in locator
+    if not isinstance(locator, str) and np.iterable(locator) and not all(
+        map(_is_number, locator)
     ):
         locator, *args = *locator, *args
     if isinstance(locator, mticker.Locator):
@@ -1003,28 +1015,28 @@ def Locator(locator, *args, discrete=False, **kwargs):
             args = args or (1,)
             if len(args) == 1:
                 args = (*args, 0)
-        elif locator in ('logminor', 'logitminor', 'symlogminor'):  # presets
+        elif locator in {'logminor', 'logitminor', 'symlogminor'}:  # presets
             locator, _ = locator.split('minor')
             if locator == 'logit':
                 kwargs.setdefault('minor', True)
             else:
                 kwargs.setdefault('subs', np.arange(1, 10))
-        if locator in LOCATORS:
-            locator = LOCATORS[locator](*args, **kwargs)
-        else:
+        cls = LOCATORS.get(locator, None)
+        if cls is None:
             raise ValueError(
                 f'Unknown locator {locator!r}. Options are: '
                 + ', '.join(map(repr, LOCATORS))
                 + '.'
             )
+        locator = cls(*args, **kwargs)
     elif locator is True:
         locator = mticker.AutoLocator(*args, **kwargs)
     elif locator is False:
         locator = mticker.NullLocator(*args, **kwargs)
-    elif isinstance(locator, Number):  # scalar variable
+    elif _is_number(locator):  # scalar variable
         locator = mticker.MultipleLocator(locator, *args, **kwargs)
     elif np.iterable(locator):
-        locator = np.array(locator)
+        locator = np.array(locator)  # copy so input arrays can be modified
         if discrete:
             locator = pticker.DiscreteLocator(locator, *args, **kwargs)
         else:
@@ -1138,20 +1150,23 @@ def Formatter(formatter, *args, date=False, index=False, **kwargs):
     proplot.axes.Axes.colorbar
     proplot.constructor.Locator
     """  # noqa: E501
-    if np.iterable(formatter) and not isinstance(formatter, str) and not all(
+    if not isinstance(formatter, str) and np.iterable(formatter) and not all(
         isinstance(item, str) for item in formatter
     ):
         formatter, *args = *formatter, *args
     if isinstance(formatter, mticker.Formatter):
         return copy.copy(formatter)
     if isinstance(formatter, str):
-        if re.search(r'{x(:.+)?}', formatter):  # str.format
+        # NOTE: Registered names never contain '{x}' or '%', so look them up
+        # first and only search for format string patterns on a miss.
+        cls = FORMATTERS.get(formatter, None)
+        if cls is not None:
+            formatter = cls(*args, **kwargs)
+        elif REGEX_STRMETHOD.search(formatter):  # str.format
             formatter = mticker.StrMethodFormatter(formatter, *args, **kwargs)
         elif '%' in formatter:  # str % format
             cls = mdates.DateFormatter if date else mticker.FormatStrFormatter
             formatter = cls(formatter, *args, **kwargs)
-        elif formatter in FORMATTERS:
-            formatter = FORMATTERS[formatter](*args, **kwargs)
         else:
             raise ValueError(
                 f'Unknown formatter {formatter!r}. Options are: '
@@ -1239,29 +1254,32 @@ def Scale(scale, *args, **kwargs):
     # of numbers are passed to Locator? Because FuncScale *itself* accepts
     # ScaleBase classes as arguments... but constructor functions cannot
     # do anything but return the class instance upon receiving one.
-    if np.iterable(scale) and not isinstance(scale, str):
-        scale, *args = *scale, *args
-    if isinstance(scale, mscale.ScaleBase):
-        return copy.copy(scale)
+    # NOTE: Test for strings first since they are by far the most common input
+    # and np.iterable has to attempt iteration.
     if not isinstance(scale, str):
-        raise ValueError(f'Invalid scale name {scale!r}. Must be string.')
+        if np.iterable(scale):
+            scale, *args = *scale, *args
+        if isinstance(scale, mscale.ScaleBase):
+            return copy.copy(scale)
+        if not isinstance(scale, str):
+            raise ValueError(f'Invalid scale name {scale!r}. Must be string.')
     scale = scale.lower()
-    if scale in SCALES_PRESETS:
+    preset = SCALES_PRESETS.get(scale, None)
+    if preset is not None:
         if args or kwargs:
             warnings._warn_proplot(
                 f'Scale {scale!r} is a scale *preset*. Ignoring positional '
-                'argument(s): {args} and keyword argument(s): {kwargs}. '
+                f'argument(s): {args} and keyword argument(s): {kwargs}. '
             )
-        scale, *args = SCALES_PRESETS[scale]
-    if scale in SCALES:
-        scale = SCALES[scale]
-    else:
+        scale, *args = preset
+    cls = SCALES.get(scale, None)
+    if cls is None:
         raise ValueError(
             f'Unknown scale or preset {scale!r}. Options are: '
             + ', '.join(map(repr, (*SCALES, *SCALES_PRESETS)))
             + '.'
         )
-    return scale(*args, **kwargs)
+    return cls(*args, **kwargs)
 
 
 def Proj(
@@ -1432,7 +1450,7 @@ def Proj(
     is_crs = Projection is not object and isinstance(name, Projection)
     is_basemap = Basemap is not object and isinstance(name, Basemap)
     include_axes = kwargs.pop('include_axes', False)  # for error message
-    if backend is not None and backend not in ('cartopy', 'basemap'):
+    if backend is not None and backend not in {'cartopy', 'basemap'}:
         raise ValueError(
             f"Invalid backend={backend!r}. Options are 'cartopy' or 'basemap'."
         )
@@ -1510,10 +1528,10 @@ def Proj(
     else:
         # Parse input arguments
         from mpl_toolkits import basemap  # ensure present  # noqa: F401
-        if name in ('eqc', 'pcarree'):
+        if name in {'eqc', 'pcarree'}:
             name = 'cyl'  # PROJ package aliases
         defaults = {'fix_aspect': True, **PROJ_DEFAULTS.get(name, {})}
-        if name[:2] in ('np', 'sp'):
+        if name[:2] in {'np', 'sp'}:
             defaults['round'] = rc['geo.round']
         if name == 'geos':
             defaults['rsphere'] = (6378137.00, 6356752.3142)
@@ -1533,15 +1551,14 @@ def Proj(
             resolution=kwargs.pop('resolution', None),
             default=rc['reso']
         )
-        if reso in RESOS_BASEMAP:
-            reso = RESOS_BASEMAP[reso]
-        else:
+        resolution = RESOS_BASEMAP.get(reso, None)
+        if resolution is None:
             raise ValueError(
                 f'Invalid resolution {reso!r}. Options are: '
                 + ', '.join(map(repr, RESOS_BASEMAP))
                 + '.'
             )
-        kwargs.update({'resolution': reso, 'projection': name})
+        kwargs.update({'resolution': resolution, 'projection': name})
         try:
             proj = Basemap(**kwargs)  # will raise helpful warning
         except ValueError as err:
@@ -20,26 +20,29 @@ def _not_none(*args, default=None, **kwargs):
     Return the first non-``None`` value. This is used with keyword arg aliases and
     for setting default values. Use `kwargs` to issue warnings when multiple passed.
     """
-    first = default
-    if args and kwargs:
-        raise ValueError('_not_none can only be used with args or kwargs.')
-    elif args:
+    # NOTE: This is called many times per plotting command so avoid building
+    # intermediate containers unless we actually have to issue a warning.
+    if not kwargs:
         for arg in args:
             if arg is not None:
-                first = arg
-                break
-    elif kwargs:
-        for name, arg in list(kwargs.items()):
-            if arg is not None:
-                first = arg
-                break
+                return arg
+        return default
+    if args:
+        raise ValueError('_not_none can only be used with args or kwargs.')
+    first = None
+    for arg in kwargs.values():
+        if arg is None:
+            continue
+        if first is None:
+            first = arg
+            continue
         kwargs = {name: arg for name, arg in kwargs.items() if arg is not None}
-        if len(kwargs) > 1:
-            warnings._warn_proplot(
-                f'Got conflicting or duplicate keyword arguments: {kwargs}. '
-                'Using the first keyword argument.'
-            )
-    return first
+        warnings._warn_proplot(
+            f'Got conflicting or duplicate keyword arguments: {kwargs}. '
+            'Using the first keyword argument.'
+        )
+        break
+    return default if first is None else first
 
 
 # Internal import statements
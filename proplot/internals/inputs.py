@@ -244,31 +244,35 @@ def _preprocess_or_redirect(*keys, keywords=None, allow_extra=True):
     """
     # Keyword arguments processed through 'data'
     # Positional arguments are always processed through data
+    # NOTE: This is the only wrapper that runs at call time (the docstring decorators
+    # modify functions in-place) so do as much work as possible up front.
     keywords = keywords or ()
     if isinstance(keywords, str):
         keywords = (keywords,)
+    keywords = frozenset(keywords)
 
     def _decorator(func):
         name = func.__name__
         from . import _kwargs_to_args
+        basemap = name in BASEMAP_FUNCS
+        cartopy = name in CARTOPY_FUNCS
 
         @functools.wraps(func)
         def _preprocess_or_redirect(self, *args, **kwargs):
             if getattr(self, '_internal_call', None):
                 # Redirect internal matplotlib call to native function
-                from ..axes import PlotAxes
-                func_native = getattr(super(PlotAxes, self), name)
-                return func_native(*args, **kwargs)
+                from ..axes.plot import _get_native
+                return _get_native(type(self), name)(self, *args, **kwargs)
             else:
                 # Impose default coordinate system
-                from ..constructor import Proj
-                if self._name == 'basemap' and name in BASEMAP_FUNCS:
+                if basemap and self._name == 'basemap':
                     if kwargs.get('latlon', None) is None:
                         kwargs['latlon'] = True
-                if self._name == 'cartopy' and name in CARTOPY_FUNCS:
+                if cartopy and self._name == 'cartopy':
                     if kwargs.get('transform', None) is None:
                         kwargs['transform'] = PlateCarree()
                     else:
+                        from ..constructor import Proj
                         kwargs['transform'] = Proj(kwargs['transform'])
 
                 # Process data args
@@ -279,7 +283,7 @@ def _preprocess_or_redirect(*keys, keywords=None, allow_extra=True):
                 data = kwargs.pop('data', None)
                 if data is not None:
                     args = _from_data(data, *args)
-                    for key in set(keywords) & set(kwargs):
+                    for key in keywords.intersection(kwargs):
                         kwargs[key] = _from_data(data, kwargs[key])
 
                 # Auto-setup matplotlib with the input unit registry
@@ -306,12 +310,21 @@ def _dist_clean(distribution):
     Clean the distrubtion data for processing by `boxplot` or `violinplot`.
     Without this invalid values break the algorithm.
     """
+    # NOTE: Index the underlying data with the mask directly rather than calling
+    # compressed() on each masked array column. This is much faster for wide input.
     if distribution.ndim == 1:
         distribution = distribution[:, None]
     distribution, units = _to_masked_array(distribution)  # no copy needed
-    distribution = tuple(
-        distribution[..., i].compressed() for i in range(distribution.shape[-1])
-    )
+    data = ma.getdata(distribution)
+    mask = ma.getmaskarray(distribution)
+    if mask.any():
+        distribution = tuple(
+            data[..., i][~mask[..., i]] for i in range(data.shape[-1])
+        )
+    else:
+        distribution = tuple(
+            data[..., i].flatten() for i in range(data.shape[-1])
+        )
     if units is not None:
         distribution = tuple(dist * units for dist in distribution)
     return distribution
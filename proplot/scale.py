@@ -3,12 +3,13 @@
 Various axis `~matplotlib.scale.ScaleBase` classes.
 """
 import copy
+import functools
+import math
 
 import matplotlib.scale as mscale
 import matplotlib.ticker as mticker
 import matplotlib.transforms as mtransforms
 import numpy as np
-import numpy.ma as ma
 
 from . import ticker as pticker
 from .internals import ic  # noqa: F401
@@ -28,6 +29,11 @@ __all__ = [
     'SymmetricalLogScale',
 ]
 
+# NOTE: Scale classes ignore unused arguments with warnings, but matplotlib 3.3
+# version changes the keyword args. Since we can't do a try except clause, only
+# way to avoid warnings with 3.3 upgrade is to test version string.
+LOGSCALE_SUFFIX = '' if _version_mpl >= '3.3' else 'x'
+
 
 def _parse_logscale_args(*keys, **kwargs):
     """
@@ -35,10 +41,6 @@ def _parse_logscale_args(*keys, **kwargs):
     inexplicably require ``x`` and ``y`` suffixes by default. Also
     change the default `linthresh` to ``1``.
     """
-    # NOTE: Scale classes ignore unused arguments with warnings, but matplotlib 3.3
-    # version changes the keyword args. Since we can't do a try except clause, only
-    # way to avoid warnings with 3.3 upgrade is to test version string.
-    kwsuffix = '' if _version_mpl >= '3.3' else 'x'
     for key in keys:
         # Remove duplicates
         opts = {
@@ -63,11 +65,28 @@ def _parse_logscale_args(*keys, **kwargs):
             if power % 1 == 0:  # exact power of 10
                 value = value + 10 ** (power - 10)
         if value is not None:  # dummy axis_name is 'x'
-            kwargs[key + kwsuffix] = value
+            kwargs[key + LOGSCALE_SUFFIX] = value
 
     return kwargs
 
 
+def _copy_float(a):
+    """
+    Return a floating point copy of the input for use with in-place ufuncs on
+    ``np.ma.getdata(copy)``. Masked arrays stay masked arrays.
+    """
+    if np.ma.isMaskedArray(a):
+        return np.ma.array(a, dtype=float, copy=True)
+    return np.array(a, dtype=float)
+
+
+class _DummyAxis(object):
+    """
+    Placeholder for the `~matplotlib.axis.Axis` expected by matplotlib scales.
+    """
+    axis_name = 'x'
+
+
 class _Scale(object):
     """
     Mix-in class that standardizes the behavior of
@@ -78,8 +97,7 @@ class _Scale(object):
     """
     def __init__(self, *args, **kwargs):
         # Pass a dummy axis to the superclass
-        axis = type('Axis', (object,), {'axis_name': 'x'})()
-        super().__init__(axis, *args, **kwargs)
+        super().__init__(_DummyAxis(), *args, **kwargs)
         self._default_major_locator = mticker.AutoLocator()
         self._default_minor_locator = mticker.AutoMinorLocator()
         self._default_major_formatter = pticker.AutoFormatter()
@@ -131,6 +149,21 @@ class _Scale(object):
         return self._transform
 
 
+class _InvertedCache(object):
+    """
+    Mix-in class that caches the transform returned by
+    `~matplotlib.transforms.Transform.inverted`. Subclasses implement
+    `_make_inverted` instead. The two transforms are linked to each other,
+    so the inverse of the inverse is the original transform.
+    """
+    def inverted(self):
+        inverted = getattr(self, '_inverted_cache', None)
+        if inverted is None:
+            inverted = self._inverted_cache = self._make_inverted()
+            inverted._inverted_cache = self
+        return inverted
+
+
 class LinearScale(_Scale, mscale.LinearScale):
     """
     As with `~matplotlib.scale.LinearScale` but with
@@ -370,13 +403,13 @@ class FuncScale(_Scale, mscale.ScaleBase):
                     ticker = getattr(scale, attr, None)
                     if ticker is None:  # e.g. someone used a matplotlib scale
                         continue  # revert to defaults
-                ticker = parser(ticker)
-                setattr(self, attr, copy.copy(ticker))
+                ticker = parser(ticker)  # returns a copy if already a ticker instance
+                setattr(self, attr, ticker)
         if kwargs:
             raise TypeError(f'FuncScale got unexpected arguments: {kwargs}')
 
 
-class FuncTransform(mtransforms.Transform):
+class FuncTransform(_InvertedCache, mtransforms.Transform):
     input_dims = 1
     output_dims = 1
     is_separable = True
@@ -390,7 +423,7 @@ class FuncTransform(mtransforms.Transform):
         else:
             raise ValueError('arguments to FuncTransform must be functions')
 
-    def inverted(self):
+    def _make_inverted(self):
         return FuncTransform(self._inverse, self._forward)
 
     def transform_non_affine(self, values):
@@ -429,7 +462,7 @@ class PowerScale(_Scale, mscale.ScaleBase):
         """
         Return the range *vmin* and *vmax* limited to positive numbers.
         """
-        if not np.isfinite(minpos):
+        if not math.isfinite(minpos):
             minpos = 1e-300
         return (
             minpos if vmin <= 0 else vmin,
@@ -437,7 +470,7 @@ class PowerScale(_Scale, mscale.ScaleBase):
         )
 
 
-class PowerTransform(mtransforms.Transform):
+class PowerTransform(_InvertedCache, mtransforms.Transform):
     input_dims = 1
     output_dims = 1
     has_inverse = True
@@ -447,7 +480,7 @@ class PowerTransform(mtransforms.Transform):
         super().__init__()
         self._power = power
 
-    def inverted(self):
+    def _make_inverted(self):
         return InvertedPowerTransform(self._power)
 
     def transform_non_affine(self, a):
@@ -455,7 +488,7 @@ class PowerTransform(mtransforms.Transform):
             return np.power(a, self._power)
 
 
-class InvertedPowerTransform(mtransforms.Transform):
+class InvertedPowerTransform(_InvertedCache, mtransforms.Transform):
     input_dims = 1
     output_dims = 1
     has_inverse = True
@@ -464,13 +497,14 @@ class InvertedPowerTransform(mtransforms.Transform):
     def __init__(self, power):
         super().__init__()
         self._power = power
+        self._exponent = 1 / power
 
-    def inverted(self):
+    def _make_inverted(self):
         return PowerTransform(self._power)
 
     def transform_non_affine(self, a):
         with np.errstate(divide='ignore', invalid='ignore'):
-            return np.power(a, 1 / self._power)
+            return np.power(a, self._exponent)
 
 
 class ExpScale(_Scale, mscale.ScaleBase):
@@ -514,16 +548,13 @@ class ExpScale(_Scale, mscale.ScaleBase):
         proplot.constructor.Scale
         """
         super().__init__()
-        if not inverse:
-            self._transform = ExpTransform(a, b, c)
-        else:
-            self._transform = InvertedExpTransform(a, b, c)
+        self._transform = _get_exp_transform(a, b, c, bool(inverse))
 
     def limit_range_for_scale(self, vmin, vmax, minpos):
         """
         Return the range *vmin* and *vmax* limited to positive numbers.
         """
-        if not np.isfinite(minpos):
+        if not math.isfinite(minpos):
             minpos = 1e-300
         return (
             minpos if vmin <= 0 else vmin,
@@ -531,7 +562,7 @@ class ExpScale(_Scale, mscale.ScaleBase):
         )
 
 
-class ExpTransform(mtransforms.Transform):
+class ExpTransform(_InvertedCache, mtransforms.Transform):
     input_dims = 1
     output_dims = 1
     has_inverse = True
@@ -542,16 +573,22 @@ class ExpTransform(mtransforms.Transform):
         self._a = a
         self._b = b
         self._c = c
+        self._k = b * np.log(a)  # exponent coefficient for natural base
 
-    def inverted(self):
+    def _make_inverted(self):
         return InvertedExpTransform(self._a, self._b, self._c)
 
     def transform_non_affine(self, a):
+        # NOTE: Work on a single float copy of the input to avoid temporaries
+        aa = np.array(a, dtype=float)
         with np.errstate(divide='ignore', invalid='ignore'):
-            return self._c * np.power(self._a, self._b * np.array(a))
+            aa *= self._k
+            np.exp(aa, out=aa)
+            aa *= self._c
+        return aa
 
 
-class InvertedExpTransform(mtransforms.Transform):
+class InvertedExpTransform(_InvertedCache, mtransforms.Transform):
     input_dims = 1
     output_dims = 1
     has_inverse = True
@@ -562,13 +599,31 @@ class InvertedExpTransform(mtransforms.Transform):
         self._a = a
         self._b = b
         self._c = c
+        self._cinv = 1.0 / c
+        self._scale = 1.0 / (b * np.log(a))
 
-    def inverted(self):
+    def _make_inverted(self):
         return ExpTransform(self._a, self._b, self._c)
 
     def transform_non_affine(self, a):
+        aa = np.array(a, dtype=float)
         with np.errstate(divide='ignore', invalid='ignore'):
-            return np.log(a / self._c) / (self._b * np.log(self._a))
+            aa *= self._cinv
+            np.log(aa, out=aa)
+            aa *= self._scale
+        return aa
+
+
+@functools.lru_cache(maxsize=None)
+def _get_exp_transform(a, b, c, inverse):
+    """
+    Return the exponential transform for the input parameters. Transforms are
+    immutable so scales with identical parameters can share them.
+    """
+    if not inverse:
+        return ExpTransform(a, b, c)
+    else:
+        return InvertedExpTransform(a, b, c)
 
 
 class MercatorLatitudeScale(_Scale, mscale.ScaleBase):
@@ -619,7 +674,7 @@ class MercatorLatitudeScale(_Scale, mscale.ScaleBase):
         return max(vmin, -self._thresh), min(vmax, self._thresh)
 
 
-class MercatorLatitudeTransform(mtransforms.Transform):
+class MercatorLatitudeTransform(_InvertedCache, mtransforms.Transform):
     input_dims = 1
     output_dims = 1
     is_separable = True
@@ -629,7 +684,7 @@ class MercatorLatitudeTransform(mtransforms.Transform):
         super().__init__()
         self._thresh = thresh
 
-    def inverted(self):
+    def _make_inverted(self):
         return InvertedMercatorLatitudeTransform(self._thresh)
 
     def transform_non_affine(self, a):
@@ -637,17 +692,22 @@ class MercatorLatitudeTransform(mtransforms.Transform):
         # in limit_range_for_scale or get weird duplicate tick labels. This
         # is not necessary for positive-only scales because it is harder to
         # run up right against the scale boundaries.
+        # NOTE: Use arcsinh(tan(x)) rather than the equivalent log(tan(x) + sec(x)),
+        # which needs more passes and suffers from cancellation near the poles. Also
+        # set out-of-range values to NaN rather than masking them. Input masks are
+        # preserved since the ufuncs operate on the data of the masked copy.
+        aa = _copy_float(a)
+        data = np.ma.getdata(aa)
+        outside = (data <= -90) | (data >= 90)
         with np.errstate(divide='ignore', invalid='ignore'):
-            m = ma.masked_where((a <= -90) | (a >= 90), a)
-            if m.mask.any():
-                m = np.deg2rad(m)
-                return ma.log(ma.abs(ma.tan(m) + 1 / ma.cos(m)))
-            else:
-                a = np.deg2rad(a)
-                return np.log(np.abs(np.tan(a) + 1 / np.cos(a)))
+            np.deg2rad(data, out=data)
+            np.tan(data, out=data)
+            np.arcsinh(data, out=data)
+        data[outside] = np.nan
+        return aa
 
 
-class InvertedMercatorLatitudeTransform(mtransforms.Transform):
+class InvertedMercatorLatitudeTransform(_InvertedCache, mtransforms.Transform):
     input_dims = 1
     output_dims = 1
     is_separable = True
@@ -657,12 +717,17 @@ class InvertedMercatorLatitudeTransform(mtransforms.Transform):
         super().__init__()
         self._thresh = thresh
 
-    def inverted(self):
+    def _make_inverted(self):
         return MercatorLatitudeTransform(self._thresh)
 
     def transform_non_affine(self, a):
-        with np.errstate(divide='ignore', invalid='ignore'):
-            return np.rad2deg(np.arctan2(1, np.sinh(a)))
+        aa = _copy_float(a)
+        data = np.ma.getdata(aa)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            np.sinh(data, out=data)
+            np.arctan(data, out=data)
+            np.rad2deg(data, out=data)
+        return aa
 
 
 class SineLatitudeScale(_Scale, mscale.ScaleBase):
@@ -702,7 +767,7 @@ class SineLatitudeScale(_Scale, mscale.ScaleBase):
         return max(vmin, -90), min(vmax, 90)
 
 
-class SineLatitudeTransform(mtransforms.Transform):
+class SineLatitudeTransform(_InvertedCache, mtransforms.Transform):
     input_dims = 1
     output_dims = 1
     is_separable = True
@@ -711,7 +776,7 @@ class SineLatitudeTransform(mtransforms.Transform):
     def __init__(self):
         super().__init__()
 
-    def inverted(self):
+    def _make_inverted(self):
         return InvertedSineLatitudeTransform()
 
     def transform_non_affine(self, a):
@@ -719,15 +784,17 @@ class SineLatitudeTransform(mtransforms.Transform):
         # in limit_range_for_scale or get weird duplicate tick labels. This
         # is not necessary for positive-only scales because it is harder to
         # run up right against the scale boundaries.
+        aa = _copy_float(a)
+        data = np.ma.getdata(aa)
+        outside = (data < -90) | (data > 90)
         with np.errstate(divide='ignore', invalid='ignore'):
-            m = ma.masked_where((a < -90) | (a > 90), a)
-            if m.mask.any():
-                return ma.sin(np.deg2rad(m))
-            else:
-                return np.sin(np.deg2rad(a))
+            np.deg2rad(data, out=data)
+            np.sin(data, out=data)
+        data[outside] = np.nan
+        return aa
 
 
-class InvertedSineLatitudeTransform(mtransforms.Transform):
+class InvertedSineLatitudeTransform(_InvertedCache, mtransforms.Transform):
     input_dims = 1
     output_dims = 1
     is_separable = True
@@ -736,7 +803,7 @@ class InvertedSineLatitudeTransform(mtransforms.Transform):
     def __init__(self):
         super().__init__()
 
-    def inverted(self):
+    def _make_inverted(self):
         return SineLatitudeTransform()
 
     def transform_non_affine(self, a):
@@ -796,7 +863,7 @@ class CutoffScale(_Scale, mscale.ScaleBase):
         self._transform = CutoffTransform(self.threshs, self.scales)
 
 
-class CutoffTransform(mtransforms.Transform):
+class CutoffTransform(_InvertedCache, mtransforms.Transform):
     input_dims = 1
     output_dims = 1
     has_inverse = True
@@ -817,39 +884,45 @@ class CutoffTransform(mtransforms.Transform):
             raise ValueError('Final scale must be finite.')
         if any(dists < 0):
             raise ValueError('Thresholds must be monotonically increasing.')
-        if any((dists == 0) | (scales == 0)):
+        if any((dists == 0) | (scales[:-1] == 0)):
             if zero_dists is None:
                 raise ValueError('Keyword zero_dists is required for discrete steps.')
-            if any((dists == 0) != (scales == 0)):
+            if any((dists == 0) != (scales[:-1] == 0)):
                 raise ValueError('Input scales disagree with discrete step locations.')
         self._scales = scales
         self._threshs = threshs
         with np.errstate(divide='ignore', invalid='ignore'):
             dists = np.concatenate((threshs[:1], dists / scales[:-1]))
             if zero_dists is not None:
-                dists[scales[:-1] == 0] = zero_dists
+                dists[1:][scales[:-1] == 0] = zero_dists
             self._dists = dists
+            self._offsets = np.cumsum(dists)  # transformed thresholds
+            self._slopes = 1.0 / scales  # also the inverse scales
+        # Segment constants indexed directly by searchsorted, with an identity
+        # segment prepended for values at or below the first threshold.
+        self._segments = (
+            np.concatenate(([0.0], threshs)),
+            np.concatenate(([1.0], self._slopes)),
+            np.concatenate(([0.0], self._offsets)),
+        )
 
-    def inverted(self):
+    def _make_inverted(self):
         # Use same algorithm for inversion!
-        threshs = np.cumsum(self._dists)  # thresholds in transformed space
-        with np.errstate(divide='ignore', invalid='ignore'):
-            scales = 1.0 / self._scales  # new scales are inverse
+        threshs = self._offsets  # thresholds in transformed space
+        scales = self._slopes  # new scales are inverse
         zero_dists = np.diff(self._threshs)[scales[:-1] == 0]
         return CutoffTransform(threshs, scales, zero_dists=zero_dists)
 
     def transform_non_affine(self, a):
-        # Cannot do list comprehension because this method sometimes
-        # received non-1D arrays
-        dists = self._dists
-        scales = self._scales
-        threshs = self._threshs
-        aa = np.array(a)  # copy
-        with np.errstate(divide='ignore', invalid='ignore'):
-            for i, ai in np.ndenumerate(a):
-                j = np.searchsorted(threshs, ai)
-                if j > 0:
-                    aa[i] = dists[:j].sum() + (ai - threshs[j - 1]) / scales[j - 1]
+        # NOTE: Find the segment for every value at once rather than looping over
+        # elements. Remaining arithmetic is done in-place to limit temporary arrays.
+        threshs, slopes, offsets = self._segments
+        a = np.asarray(a, dtype=float)
+        i = np.searchsorted(self._threshs, a)
+        with np.errstate(invalid='ignore'):
+            aa = a - threshs[i]
+            aa *= slopes[i]
+            aa += offsets[i]
         return aa
 
 
@@ -884,7 +957,7 @@ class InverseScale(_Scale, mscale.ScaleBase):
         # Unlike log-scale, we can't just warp the space between
         # the axis limits -- have to actually change axis limits. Also this
         # scale will invert and swap the limits you provide.
-        if not np.isfinite(minpos):
+        if not math.isfinite(minpos):
             minpos = 1e-300
         return (
             minpos if vmin <= 0 else vmin,
@@ -892,7 +965,7 @@ class InverseScale(_Scale, mscale.ScaleBase):
         )
 
 
-class InverseTransform(mtransforms.Transform):
+class InverseTransform(_InvertedCache, mtransforms.Transform):
     # Create transform object
     input_dims = 1
     output_dims = 1
@@ -902,12 +975,12 @@ class InverseTransform(mtransforms.Transform):
     def __init__(self):
         super().__init__()
 
-    def inverted(self):
+    def _make_inverted(self):
         return InverseTransform()
 
     def transform_non_affine(self, a):
         with np.errstate(divide='ignore', invalid='ignore'):
-            return 1.0 / a
+            return np.reciprocal(a, dtype=float)
 
 
 def _scale_factory(scale, axis, *args, **kwargs):  # noqa: U100
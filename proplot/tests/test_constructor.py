@@ -0,0 +1,19 @@
+import matplotlib.ticker as mticker
+import numpy as np
+
+import proplot as pplt
+
+
+def test_locator_copies_input():
+    """Tests that fixed locators are unaffected by changes to the input array."""
+    locs = np.array([1.0, 2.0, 3.0])
+    locator = pplt.Locator(locs)
+    locs *= 10
+    assert np.allclose(locator.locs, [1, 2, 3])
+
+
+def test_fixed_formatter():
+    """Tests that the 'fixed' formatter name returns a fixed formatter."""
+    formatter = pplt.Formatter('fixed', ['a', 'b'])
+    assert isinstance(formatter, mticker.FixedFormatter)
+    assert formatter(0, 1) == 'b'
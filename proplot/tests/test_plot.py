@@ -0,0 +1,61 @@
+import numpy as np
+
+import proplot as pplt
+
+
+def test_cmap_cache_rc_changes():
+    """Tests that colormaps generated from colors respect rc changes."""
+    z = np.random.RandomState(51423).rand(3, 3)
+    fig, axs = pplt.subplots()
+    ax = axs[0]
+    color = ax.pcolormesh(z, cmap='C0').get_cmap()(1.0)
+    with pplt.rc.context(cycle='Set1'):
+        cmap = ax.pcolormesh(z, cmap='C0').get_cmap()
+        assert np.allclose(cmap(1.0), pplt.to_rgba('C0'), atol=1e-3)
+    assert np.allclose(ax.pcolormesh(z, cmap='C0').get_cmap()(1.0), color)
+    with pplt.rc.context({'image.lut': 16}):
+        assert ax.pcolormesh(z, cmap='red').get_cmap().N == 16
+
+
+def test_cmap_cache_copies():
+    """Tests that modifying a colormap does not affect later colormaps."""
+    z = np.random.RandomState(51423).rand(3, 3)
+    fig, axs = pplt.subplots()
+    ax = axs[0]
+    for _ in range(2):  # modify both the generated and the cached colormap
+        cmap = ax.pcolormesh(z, cmap='viridis', discrete=False).get_cmap()
+        cmap.set_alpha(0.2)
+    cmap = ax.pcolormesh(z, cmap='viridis', discrete=False).get_cmap()
+    assert cmap(0.5)[3] == 1.0
+    assert cmap.copy(N=64)(0.5)[3] == 1.0
+
+def test_heatmap_integer_coordinates():
+    """Tests that heatmap tick locations are computed for integer coordinates."""
+    z = np.random.RandomState(51423).rand(3, 4)
+    fig, axs = pplt.subplots()
+    ax = axs[0]
+    ax.heatmap(np.arange(5), np.arange(4), z)
+    assert np.allclose(ax.xaxis.get_major_locator().locs, [0.5, 1.5, 2.5, 3.5])
+    assert np.allclose(ax.yaxis.get_major_locator().locs, [0.5, 1.5, 2.5])
+
+
+def test_violinplot_fillalpha():
+    """Tests that scalar fill opacities are applied to every violin body."""
+    data = np.random.RandomState(51423).normal(size=(20, 3))
+    fig, axs = pplt.subplots()
+    # NOTE: Native matplotlib >= 3.6 violin() validates the default colormap name
+    # against its own registry, which does not include proplot's 'Fire' default.
+    with pplt.rc.context({'image.cmap': 'viridis'}):
+        bodies = axs[0].violinplot(data, fillalpha=0.5)
+    assert [body.get_alpha() for body in bodies] == [0.5, 0.5, 0.5]
+
+
+def test_boxplot_cap_whisker_props():
+    """Tests that per-box cap and whisker properties are applied to both lines."""
+    data = np.random.RandomState(51423).normal(size=(20, 3))
+    fig, axs = pplt.subplots()
+    colors = ['red', 'green', 'blue']
+    artists = axs[0].boxplot(data, capcolor=colors, whiskercolor=colors)
+    for key in ('caps', 'whiskers'):
+        result = [line.get_color() for line in artists[key]]
+        assert result == [color for color in colors for _ in range(2)]
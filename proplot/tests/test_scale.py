@@ -0,0 +1,50 @@
+import numpy as np
+
+import proplot as pplt
+
+
+def test_mercator_round_trip():
+    """Tests that the Mercator latitude transform is inverted exactly."""
+    lats = np.linspace(-80, 80, 17)
+    transform = pplt.MercatorLatitudeScale().get_transform()
+    result = transform.inverted().transform_non_affine(
+        transform.transform_non_affine(lats)
+    )
+    assert np.allclose(result, lats)
+
+
+def test_cutoff_round_trip():
+    """Tests that cutoff transforms with several thresholds are inverted exactly."""
+    values = np.linspace(-5, 60, 27)
+    transform = pplt.CutoffScale(10, 0.5, 20, 2, 40).get_transform()
+    result = transform.inverted().transform_non_affine(
+        transform.transform_non_affine(values)
+    )
+    assert np.allclose(result, values)
+
+
+def test_mercator_masked():
+    """Tests that the Mercator latitude transform preserves input masks."""
+    lats = np.ma.masked_array([10, 20, 30], mask=[False, True, False])
+    transform = pplt.MercatorLatitudeScale().get_transform()
+    result = transform.transform_non_affine(lats)
+    assert np.ma.isMaskedArray(result)
+    assert result.mask.tolist() == [False, True, False]
+
+
+def test_inverted_mercator_masked():
+    """Tests that the inverse Mercator latitude transform preserves input masks."""
+    values = np.ma.masked_array([0.1, 0.2, 0.3], mask=[False, True, False])
+    transform = pplt.MercatorLatitudeScale().get_transform().inverted()
+    result = transform.transform_non_affine(values)
+    assert np.ma.isMaskedArray(result)
+    assert result.mask.tolist() == [False, True, False]
+
+
+def test_sine_masked():
+    """Tests that the sine latitude transform preserves input masks."""
+    lats = np.ma.masked_array([10, 20, 30], mask=[False, True, False])
+    transform = pplt.SineLatitudeScale().get_transform()
+    result = transform.transform_non_affine(lats)
+    assert np.ma.isMaskedArray(result)
+    assert result.mask.tolist() == [False, True, False]
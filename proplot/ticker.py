@@ -3,7 +3,6 @@
 Various `~matplotlib.ticker.Locator` and `~matplotlib.ticker.Formatter` classes.
 """
 import locale
-import re
 from fractions import Fraction
 
 import matplotlib.axis as maxis
@@ -42,9 +41,7 @@ __all__ = [
     'LatitudeFormatter',
 ]
 
-REGEX_ZERO = re.compile('\\A[-\N{MINUS SIGN}]?0(.0*)?\\Z')
-REGEX_MINUS = re.compile('\\A[-\N{MINUS SIGN}]\\Z')
-REGEX_MINUS_ZERO = re.compile('\\A[-\N{MINUS SIGN}]0(.0*)?\\Z')
+MINUS_SIGNS = ('-', '\N{MINUS SIGN}')
 
 _precision_docstring = """
 precision : int, default: {6, 2}
@@ -94,11 +91,22 @@ dms : bool, default: False
 docstring._snippet_manager['ticker.dms'] = _dms_docstring
 
 
+def _default_zerotrim(zerotrim=None):
+    """
+    Return the default zerotrim. Shared by several formatters.
+    """
+    # NOTE: Only look up the setting when needed rather than always evaluating
+    # the _not_none() fallback. Must not be cached since rc can change.
+    if zerotrim is None:
+        zerotrim = rc['formatter.zerotrim']
+    return zerotrim
+
+
 def _default_precision_zerotrim(precision=None, zerotrim=None):
     """
     Return the default zerotrim and precision. Shared by several formatters.
     """
-    zerotrim = _not_none(zerotrim, rc['formatter.zerotrim'])
+    zerotrim = _default_zerotrim(zerotrim)
     if precision is None:
         precision = 6 if zerotrim else 2
     return precision, zerotrim
@@ -374,10 +382,8 @@ class AutoFormatter(mticker.ScalarFormatter):
         this behavior, making it suitable for arbitrary axis scales. We
         therefore use `AutoFormatter` with every axis scale by default.
         """
-        tickrange = tickrange or (-np.inf, np.inf)
         super().__init__(**kwargs)
-        zerotrim = _not_none(zerotrim, rc['formatter.zerotrim'])
-        self._zerotrim = zerotrim
+        self._zerotrim = _default_zerotrim(zerotrim)
         self._tickrange = tickrange
         self._wraprange = wraprange
         self._prefix = prefix or ''
@@ -409,8 +415,8 @@ class AutoFormatter(mticker.ScalarFormatter):
             string = self._trim_trailing_zeros(string, self._get_decimal_point())
 
         # Prefix and suffix
-        string = self._add_prefix_suffix(string, self._prefix, self._suffix)
-        string = string + tail  # add negative-positive indicator
+        # NOTE: The negative-positive indicator follows the suffix
+        string = self._add_prefix_suffix(string, self._prefix, self._suffix + tail)
         return string
 
     def get_offset(self):
@@ -425,12 +431,14 @@ class AutoFormatter(mticker.ScalarFormatter):
         """
         Add prefix and suffix to string.
         """
+        if not prefix and not suffix:
+            return string
         sign = ''
         prefix = prefix or ''
         suffix = suffix or ''
-        if string and REGEX_MINUS.match(string[0]):
+        if string[:1] in MINUS_SIGNS:
             sign, string = string[0], string[1:]
-        return sign + prefix + string + suffix
+        return f'{sign}{prefix}{string}{suffix}'
 
     def _fix_small_number(self, x, string, precision_offset=2):
         """
@@ -443,29 +451,28 @@ class AutoFormatter(mticker.ScalarFormatter):
         # truncate if value is within `offset` order of magnitude of the float
         # precision. Common issue is e.g. levels=pplt.arange(-1, 1, 0.1).
         # This choice satisfies even 1000 additions of 0.1 to -100.
-        m = REGEX_ZERO.match(string)
-        decimal_point = self._get_decimal_point()
-
-        if m and x != 0:
-            # Get initial precision spit out by algorithm
-            decimals, = m.groups()
-            precision_init = len(decimals.lstrip(decimal_point)) if decimals else 0
+        decimals = self._zero_decimals(string)
+        if decimals is None or x == 0:
+            return string
 
-            # Format with precision below floating point error
-            x -= getattr(self, 'offset', 0)  # guard against API change
-            x /= 10 ** getattr(self, 'orderOfMagnitude', 0)  # guard against API change
-            precision_true = max(0, self._decimal_place(x))
-            precision_max = max(0, np.finfo(type(x)).precision - precision_offset)
-            precision = min(precision_true, precision_max)
-            string = ('{:.%df}' % precision).format(x)
+        # Get initial precision spit out by algorithm
+        decimal_point = self._get_decimal_point()
+        precision_init = len(decimals.lstrip(decimal_point)) if decimals else 0
 
-            # If zero ignoring floating point error then match original precision
-            if REGEX_ZERO.match(string):
-                string = ('{:.%df}' % precision_init).format(0)
+        # Format with precision below floating point error
+        x -= getattr(self, 'offset', 0)  # guard against API change
+        x /= 10 ** getattr(self, 'orderOfMagnitude', 0)  # guard against API change
+        precision_true = max(0, self._decimal_place(x))
+        precision_max = max(0, np.finfo(type(x)).precision - precision_offset)
+        precision = min(precision_true, precision_max)
+        string = f'{x:.{precision}f}'
 
-            # Fix decimal point
-            string = string.replace('.', decimal_point)
+        # If zero ignoring floating point error then match original precision
+        if self._zero_decimals(string) is not None:
+            string = f'{0:.{precision_init}f}'
 
+        # Fix decimal point
+        string = string.replace('.', decimal_point)
         return string
 
     def _get_decimal_point(self, use_locale=None):
@@ -494,6 +501,19 @@ class AutoFormatter(mticker.ScalarFormatter):
             digits = -int(np.log10(abs(x)) // 1)
         return digits
 
+    @staticmethod
+    def _zero_decimals(string):
+        """
+        Return the decimal part of a string formatted as zero (e.g., ``'.000'`` for
+        ``'-0.000'``) or ``None`` if the string is not zero. Uses string operations
+        rather than a regular expression since this is called for every tick.
+        """
+        if string[:1] in MINUS_SIGNS:
+            string = string[1:]
+        if string[:1] != '0' or string[2:].strip('0'):
+            return None
+        return string[1:]
+
     @staticmethod
     def _minus_format(string):
         """
@@ -501,8 +521,11 @@ class AutoFormatter(mticker.ScalarFormatter):
         """
         if rc['axes.unicode_minus'] and not rc['text.usetex']:
             string = string.replace('-', '\N{MINUS SIGN}')
-        if REGEX_MINUS_ZERO.match(string):
-            string = string[1:]
+        # NOTE: Use string operations rather than a regular expression since
+        # this is called for every tick.
+        if string[:1] in MINUS_SIGNS:
+            if AutoFormatter._zero_decimals(string) is not None:
+                string = string[1:]
         return string
 
     @staticmethod
@@ -533,6 +556,8 @@ class AutoFormatter(mticker.ScalarFormatter):
         """
         Return whether point is outside tick range up to some precision.
         """
+        if not tickrange:  # all ticks are labeled by default
+            return False
         eps = abs(x) / 1000
         return (x + eps) < tickrange[0] or (x - eps) > tickrange[1]
 
@@ -586,7 +611,7 @@ class SimpleFormatter(mticker.Formatter):
         self._prefix = prefix or ''
         self._suffix = suffix or ''
         self._negpos = negpos or ''
-        self._tickrange = tickrange or (-np.inf, np.inf)
+        self._tickrange = tickrange
         self._wraprange = wraprange
         self._zerotrim = zerotrim
 
@@ -607,7 +632,7 @@ class SimpleFormatter(mticker.Formatter):
 
         # Default string formatting
         decimal_point = AutoFormatter._get_default_decimal_point()
-        string = ('{:.%df}' % self._precision).format(x)
+        string = f'{x:.{self._precision}f}'
         string = string.replace('.', decimal_point)
 
         # Custom string formatting
@@ -616,8 +641,10 @@ class SimpleFormatter(mticker.Formatter):
             string = AutoFormatter._trim_trailing_zeros(string, decimal_point)
 
         # Prefix and suffix
-        string = AutoFormatter._add_prefix_suffix(string, self._prefix, self._suffix)
-        string = string + tail  # add negative-positive indicator
+        # NOTE: The negative-positive indicator follows the suffix
+        string = AutoFormatter._add_prefix_suffix(
+            string, self._prefix, self._suffix + tail
+        )
         return string
 
 
@@ -668,7 +695,7 @@ class SciFormatter(mticker.Formatter):
         """
         # Get string
         decimal_point = AutoFormatter._get_default_decimal_point()
-        string = ('{:.%de}' % self._precision).format(x)
+        string = f'{x:.{self._precision}e}'
         parts = string.split('e')
 
         # Trim trailing zeros
@@ -715,7 +742,7 @@ class SigFigFormatter(mticker.Formatter):
         proplot.ticker.AutoFormatter
         """
         self._sigfig = _not_none(sigfig, 3)
-        self._zerotrim = _not_none(zerotrim, rc['formatter.zerotrim'])
+        self._zerotrim = _default_zerotrim(zerotrim)
         self._base = _not_none(base, 1)
 
     @docstring._snippet_manager
@@ -731,7 +758,7 @@ class SigFigFormatter(mticker.Formatter):
         # Create the string
         decimal_point = AutoFormatter._get_default_decimal_point()
         precision = max(0, digits) + max(0, AutoFormatter._decimal_place(self._base))
-        string = ('{:.%df}' % precision).format(x)
+        string = f'{x:.{precision}f}'
         string = string.replace('.', decimal_point)
 
         # Custom string formatting
@@ -767,6 +794,7 @@ class FracFormatter(mticker.Formatter):
         """
         self._symbol = symbol
         self._number = number
+        self._cache = {}
         super().__init__()
 
     @docstring._snippet_manager
@@ -774,25 +802,83 @@ class FracFormatter(mticker.Formatter):
         """
         %(ticker.call)s
         """
-        frac = Fraction(x / self._number).limit_denominator()
+        return self._cached_string(x)
+
+    def format_ticks(self, values):
+        """
+        Return the tick labels for all the ticks at once.
+        """
+        # NOTE: Detect integer multiples of the number for every tick at once rather
+        # than one at a time in _get_fraction(). Remaining ticks use the scalar path.
+        self.set_locs(values)
+        values = np.asarray(values, dtype=float)
+        numerators = self._get_numerators(values)
+        return [
+            self._cached_string(x, numerator)
+            for x, numerator in zip(values.tolist(), numerators.tolist())
+        ]
+
+    def _cached_string(self, x, numerator=None):
+        """
+        Return the cached fraction string for the number.
+        """
+        # NOTE: Cache strings by tick value since the same ticks are drawn over and
+        # over and limit_denominator() is slow. The minus sign is formatted after
+        # since it depends on rc settings. Clear the cache if it gets too large.
+        string = self._cache.get(x, None)
+        if string is None:
+            if len(self._cache) >= 512:
+                self._cache.clear()
+            string = self._cache[x] = self._get_fraction(x, numerator)
+        string = AutoFormatter._minus_format(string)
+        return string
+
+    def _get_numerators(self, values):
+        """
+        Return the integer multiples of the number or NaN for other values.
+        """
+        # NOTE: Skip limit_denominator() for integer multiples of the number. This
+        # gives identical results since any other fraction with denominator up to
+        # the default limit of 1e6 is at least 1e-6 away from the integer.
+        quotients = np.divide(values, self._number)
+        numerators = np.round(quotients)
+        return np.where(np.abs(quotients - numerators) < 1e-9, numerators, np.nan)
+
+    def _get_fraction(self, x, numerator=None):
+        """
+        Return the fraction string for the number. The numerator is the integer
+        multiple from `_get_numerators` if it was already computed.
+        """
+        if numerator is None:
+            numerator = float(self._get_numerators(x))
+        if np.isnan(numerator):
+            frac = Fraction(x / self._number).limit_denominator()
+            numerator, denominator = frac.numerator, frac.denominator
+        else:
+            numerator, denominator = int(numerator), 1
+        return self._format_fraction(x, numerator, denominator)
+
+    def _format_fraction(self, x, numerator, denominator):
+        """
+        Return the string for the numerator and denominator.
+        """
         symbol = self._symbol
         if x == 0:
             string = '0'
-        elif frac.denominator == 1:  # denominator is one
-            if frac.numerator == 1 and symbol:
+        elif denominator == 1:  # denominator is one
+            if numerator == 1 and symbol:
                 string = f'{symbol:s}'
-            elif frac.numerator == -1 and symbol:
+            elif numerator == -1 and symbol:
                 string = f'-{symbol:s}'
             else:
-                string = f'{frac.numerator:d}{symbol:s}'
+                string = f'{numerator:d}{symbol:s}'
         else:
-            if frac.numerator == 1 and symbol:  # numerator is +/-1
-                string = f'{symbol:s}/{frac.denominator:d}'
-            elif frac.numerator == -1 and symbol:
-                string = f'-{symbol:s}/{frac.denominator:d}'
+            if numerator == 1 and symbol:  # numerator is +/-1
+                string = f'{symbol:s}/{denominator:d}'
+            elif numerator == -1 and symbol:
+                string = f'-{symbol:s}/{denominator:d}'
             else:  # and again make sure we use unicode minus!
-                string = f'{frac.numerator:d}{symbol:s}/{frac.denominator:d}'
-        string = AutoFormatter._minus_format(string)
+                string = f'{numerator:d}{symbol:s}/{denominator:d}'
         return string
 
 
@@ -804,15 +890,17 @@ class _CartopyFormatter(object):
     # input values from map projection coordinates to Plate Carrée coordinates.
     # After 0.18 you can avoid this behavior by not setting axis but really
     # dislike that inconsistency. Solution is temporarily assign PlateCarre().
+    # NOTE: Skip the context manager when no axis is assigned and create the
+    # Plate Carrée projection once rather than on every tick.
     def __init__(self, *args, **kwargs):
         import cartopy  # noqa: F401 (ensure available)
         super().__init__(*args, **kwargs)
+        self._plate_carree = ccrs.PlateCarree()
 
     def __call__(self, value, pos=None):
-        ctx = context._empty_context()
-        if self.axis is not None:
-            ctx = context._state_context(self.axis.axes, projection=ccrs.PlateCarree())
-        with ctx:
+        if self.axis is None:
+            return super().__call__(value, pos)
+        with context._state_context(self.axis.axes, projection=self._plate_carree):
             return super().__call__(value, pos)
 
 